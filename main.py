@@ -7,6 +7,7 @@ Entry point for the application
 import sys
 import os
 import time
+import logging
 
 def setup_debug_logging():
     """Setup logging to ~/Desktop/mwhisper_debug.log for frozen apps"""
@@ -24,6 +25,7 @@ def setup_debug_logging():
 
 # Setup logging before imports to capture import errors
 setup_debug_logging()
+logging.basicConfig(stream=sys.stdout, level=logging.WARNING, format="%(message)s")
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
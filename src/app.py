@@ -8,7 +8,6 @@ import threading
 import subprocess
 from typing import Optional
 import numpy as np
-import platform
 
 from .audio_capture import AudioCapture, get_audio_level
 from .transcriber import Transcriber
@@ -20,8 +19,7 @@ from .settings import Settings, get_settings
 from .history import DictationHistory, get_history
 from .menu_bar import MenuBarApp, create_menu_bar_app
 from .translator import Translator
-from .settings_window import show_settings_window
-from .platform import is_macos, is_windows
+from .platform import IS_MACOS, IS_WINDOWS
 
 
 def check_accessibility_permission() -> bool:
@@ -30,12 +28,12 @@ def check_accessibility_permission() -> bool:
     On macOS: prompts for Accessibility permission
     On Windows: always returns True (no special permissions needed)
     """
-    if is_windows():
+    if IS_WINDOWS:
         # Windows doesn't require special accessibility permissions
         print("✓ Running on Windows - no accessibility permission needed")
         return True
     
-    if not is_macos():
+    if not IS_MACOS:
         # Linux - assume permissions are OK
         return True
     
@@ -98,7 +96,7 @@ def check_accessibility_permission() -> bool:
 
 def open_input_monitoring_settings():
     """Open System Settings → Input Monitoring for hotkey permissions (macOS only)"""
-    if not is_macos():
+    if not IS_MACOS:
         return
     print("\n⚠️  Input Monitoring permission may be required for hotkeys!")
     print("Opening System Settings → Input Monitoring...")
@@ -443,7 +441,7 @@ class MWhisperApp:
         
         # Update history menu
         if self._menu_app:
-            history_items = [str(e) for e in self.history.get_recent(10)]
+            history_items = self.history.get_recent_rendered(10)
             self._menu_app.update_history_menu(history_items)
         
         # Insert translated text
@@ -583,7 +581,7 @@ class MWhisperApp:
         
         # Update history menu
         if self._menu_app:
-            history_items = [str(e) for e in self.history.get_recent(10)]
+            history_items = self.history.get_recent_rendered(10)
             self._menu_app.update_history_menu(history_items)
         
         # Insert text
@@ -658,7 +656,7 @@ class MWhisperApp:
         
         # Update history menu
         if self._menu_app:
-            history_items = [str(e) for e in self.history.get_recent(10)]
+            history_items = self.history.get_recent_rendered(10)
             self._menu_app.update_history_menu(history_items)
         
         # Insert text
@@ -716,6 +714,8 @@ class MWhisperApp:
                     print("Settings saved, reloading...")
                     # Schedule reload on main thread via timer flag
                     self._needs_settings_reload = True
+                    if self._menu_app:
+                        self._menu_app.request_tick()
                 else:
                     if process.stderr:
                         print(f"Settings error: {process.stderr}")
@@ -903,6 +903,9 @@ class MWhisperApp:
         # Stop recording if active
         if self._is_recording and self._audio_capture:
             self._audio_capture.stop()
+        
+        # Write out any deferred settings change
+        self.settings.flush()
     
     def _on_change_hotkey(self) -> None:
         """Handle change hotkey request"""
@@ -1022,7 +1025,7 @@ class MWhisperApp:
         )
         
         # Update history menu
-        history_items = [str(e) for e in self.history.get_recent(10)]
+        history_items = self.history.get_recent_rendered(10)
         self._menu_app.update_history_menu(history_items)
         
         print(f"\n✓ Ready! (Push-to-talk mode)")
@@ -5,13 +5,19 @@ Stores and manages recent dictations
 
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 
+# Serialized fields of a DictationEntry, in file order
+_ENTRY_KEYS = ("text", "timestamp", "duration", "language")
+
+
 class DictationEntry:
     """Represents a single dictation entry"""
     
+    __slots__ = _ENTRY_KEYS
+    
     def __init__(
         self,
         text: str,
@@ -69,10 +75,24 @@ class DictationHistory:
         
         self.max_size = max_size
         self._entries: List[DictationEntry] = []
-        self.load()
+        self._rendered_cache: Optional[List[str]] = None
+        self._snapshot: Optional[Tuple[DictationEntry, ...]] = None
+        # History file is read on first access, not at startup
+        self._loaded = False
+    
+    def _invalidate_caches(self) -> None:
+        """Drop cached views after the entry list changes"""
+        self._rendered_cache = None
+        self._snapshot = None
+    
+    def _ensure_loaded(self) -> None:
+        """Load history from file on first access"""
+        if not self._loaded:
+            self.load()
     
     def load(self) -> bool:
         """Load history from file"""
+        self._loaded = True
         try:
             if self.history_path.exists():
                 with open(self.history_path, 'r', encoding='utf-8') as f:
@@ -82,6 +102,7 @@ class DictationHistory:
                     DictationEntry.from_dict(entry)
                     for entry in data.get("entries", [])
                 ]
+                self._invalidate_caches()
                 return True
         except Exception as e:
             print(f"Failed to load history: {e}")
@@ -89,6 +110,7 @@ class DictationHistory:
     
     def save(self) -> bool:
         """Save history to file"""
+        self._ensure_loaded()
         try:
             self.history_path.parent.mkdir(parents=True, exist_ok=True)
             
@@ -121,6 +143,7 @@ class DictationHistory:
         Returns:
             Created entry
         """
+        self._ensure_loaded()
         entry = DictationEntry(
             text=text,
             duration=duration,
@@ -134,47 +157,73 @@ class DictationHistory:
         if len(self._entries) > self.max_size:
             self._entries = self._entries[:self.max_size]
         
+        self._invalidate_caches()
         self.save()
         return entry
     
-    def get_all(self) -> List[DictationEntry]:
-        """Get all entries (most recent first)"""
+    def get_all(self) -> Tuple[DictationEntry, ...]:
+        """Get all entries (most recent first) as a read-only snapshot"""
+        self._ensure_loaded()
+        if self._snapshot is None:
+            self._snapshot = tuple(self._entries)
+        return self._snapshot
+    
+    def get_all_copy(self) -> List[DictationEntry]:
+        """Get a mutable copy of all entries (most recent first)"""
+        self._ensure_loaded()
         return self._entries.copy()
     
     def get_recent(self, count: int = 5) -> List[DictationEntry]:
         """Get recent entries"""
+        self._ensure_loaded()
         return self._entries[:count]
     
+    def get_recent_rendered(self, count: int = 5) -> List[str]:
+        """Get display strings for recent entries (cached until history changes)"""
+        self._ensure_loaded()
+        if self._rendered_cache is None:
+            self._rendered_cache = [str(e) for e in self._entries]
+        return self._rendered_cache[:count]
+    
     def get_by_index(self, index: int) -> Optional[DictationEntry]:
         """Get entry by index"""
+        self._ensure_loaded()
         if 0 <= index < len(self._entries):
             return self._entries[index]
         return None
     
     def clear(self) -> None:
         """Clear all history"""
+        self._loaded = True
         self._entries = []
+        self._invalidate_caches()
         self.save()
     
     def delete(self, index: int) -> bool:
         """Delete entry by index"""
+        self._ensure_loaded()
         if 0 <= index < len(self._entries):
             self._entries.pop(index)
+            self._invalidate_caches()
             self.save()
             return True
         return False
     
     def set_max_size(self, size: int) -> None:
         """Set maximum history size"""
+        self._ensure_loaded()
         self.max_size = size
         if len(self._entries) > size:
             self._entries = self._entries[:size]
+            self._invalidate_caches()
             self.save()
     
     def __len__(self) -> int:
+        self._ensure_loaded()
         return len(self._entries)
     
     def __iter__(self):
+        self._ensure_loaded()
         return iter(self._entries)
 
 
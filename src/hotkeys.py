@@ -5,14 +5,18 @@ Uses pynput for global keyboard monitoring
 """
 
 from pynput import keyboard
-from typing import Callable, Optional, Set
+from typing import Callable, FrozenSet, Optional, Set, Tuple
+import functools
+import logging
+import queue
+import re
 import threading
-import subprocess
-import platform
 
-# Platform detection
-IS_WINDOWS = platform.system() == "Windows"
-IS_MACOS = platform.system() == "Darwin"
+from .platform import IS_WINDOWS, IS_MACOS
+
+# Used on the listener thread instead of print(); silent unless the app configures logging
+logger = logging.getLogger('mwhisper.hotkeys')
+logger.addHandler(logging.NullHandler())
 
 
 # Virtual Key Code Map for macOS (QWERTY Physical -> VK Code)
@@ -36,30 +40,115 @@ LAYOUT_MAP = {
 # Reverse mapping for robust key name resolution (VK -> QWERTY char)
 VK_TO_CHAR = {v: k for k, v in VK_MAP.items()}
 
-def get_safe_key_name(key) -> Optional[str]:
+# Index-based lookup tables for the per-keystroke path
+_VK_TABLE_SIZE = 64
+_VK_TO_CHAR_TBL = tuple(VK_TO_CHAR.get(vk) for vk in range(_VK_TABLE_SIZE))
+_LAYOUT_TRANS = str.maketrans(LAYOUT_MAP)
+
+
+def _normalize_key_name(name: str) -> str:
+    """Lowercase a pynput key name and strip its left/right suffix"""
+    name = name.lower()
+    if name.endswith(('_r', '_l')):
+        name = name[:-2]
+    return name
+
+
+# pynput special key names (keyboard.Key members) -> normalized name
+_KEY_NAMES = {key.name: _normalize_key_name(key.name) for key in keyboard.Key}
+
+# pynput modifier key names -> normalized modifier name
+_MODIFIER_BASE = {
+    'cmd': 'cmd', 'cmd_r': 'cmd',
+    'ctrl': 'ctrl', 'ctrl_r': 'ctrl',
+    'alt': 'alt', 'alt_r': 'alt',
+    'shift': 'shift', 'shift_r': 'shift',
+}
+_MODIFIER_KEYS = frozenset(_MODIFIER_BASE)
+
+# Modifier names as they appear in hotkey strings
+_HOTKEY_MODIFIERS = frozenset(_MODIFIER_BASE.values())
+
+# Canonical modifier order for generated hotkey strings
+_MOD_ORDER = ('cmd', 'ctrl', 'alt', 'shift')
+
+# Bit per modifier for the pressed-modifier mask
+_MOD_BITS = {'cmd': 1, 'ctrl': 2, 'alt': 4, 'shift': 8}
+# pynput modifier key names -> modifier bit
+_MODIFIER_KEY_BITS = {name: _MOD_BITS[base] for name, base in _MODIFIER_BASE.items()}
+
+# Key name mappings for display - platform specific
+if IS_MACOS:
+    KEY_DISPLAY_NAMES = {
+        'cmd': '⌘',
+        'ctrl': '⌃',
+        'alt': '⌥',
+        'shift': '⇧',
+        'space': 'Space',
+    }
+else:
+    # Windows/Linux
+    KEY_DISPLAY_NAMES = {
+        'cmd': 'Win',
+        'ctrl': 'Ctrl',
+        'alt': 'Alt',
+        'shift': 'Shift',
+        'space': 'Space',
+    }
+
+# Single-pass normalization of hotkey strings ('<command>' -> 'cmd', etc.)
+_HOTKEY_ALIASES = {'command': 'cmd', 'control': 'ctrl', 'option': 'alt', '<': '', '>': ''}
+_HOTKEY_ALIAS_RE = re.compile('|'.join(map(re.escape, _HOTKEY_ALIASES)))
+
+
+@functools.lru_cache(maxsize=64)
+def _split_hotkey(hotkey: str) -> Tuple[str, ...]:
+    """Normalize a hotkey string and split it into its parts"""
+    normalized = _HOTKEY_ALIAS_RE.sub(lambda m: _HOTKEY_ALIASES[m.group(0)], hotkey.lower())
+    return tuple(part.strip() for part in normalized.split('+'))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_hotkey_cached(hotkey: str) -> Tuple[FrozenSet[str], Optional[str], str]:
+    """Parse hotkey string into (modifiers, main key, display string)"""
+    modifiers = set()
+    main_key = None
+    display_parts = []
+    
+    for part in _split_hotkey(hotkey):
+        if part in _HOTKEY_MODIFIERS:
+            modifiers.add(part)
+        else:
+            main_key = part
+        display_parts.append(KEY_DISPLAY_NAMES.get(part, part.upper()))
+    
+    return frozenset(modifiers), main_key, ''.join(display_parts)
+
+def get_safe_key_name(key, _vk_tbl=_VK_TO_CHAR_TBL, _layout=_LAYOUT_TRANS, _names=_KEY_NAMES) -> Optional[str]:
     """
     Get normalized key name using robust strategy (VK -> Char -> Name).
     This function is CRASH-PROOF for Ukrainian/International layouts.
     """
     # 1. Check valid VK (Physical) - Primary Source of Truth
-    if hasattr(key, 'vk') and key.vk in VK_TO_CHAR:
-        return VK_TO_CHAR[key.vk]
+    vk = getattr(key, 'vk', None)
+    if vk is not None and 0 <= vk < _VK_TABLE_SIZE:
+        name = _vk_tbl[vk]
+        if name is not None:
+            return name
         
     # 2. Check explicitly handled modifiers/specials (pynput standard names)
-    if hasattr(key, 'name'):
-        name = key.name.lower()
-        if name.endswith('_r') or name.endswith('_l'):
-             name = name[:-2]
-        return name
+    name = getattr(key, 'name', None)
+    if name is not None:
+        normalized = _names.get(name)
+        return normalized if normalized is not None else _normalize_key_name(name)
         
     # 3. Fallback to char (Risky on some layouts, so wrap in try/except)
     try:
-        if hasattr(key, 'char') and key.char:
-            char = key.char.lower()
+        char = getattr(key, 'char', None)
+        if char:
+            char = char.lower()
             # Normalize via LAYOUT_MAP just in case we ended up here
-            if char in LAYOUT_MAP:
-                return LAYOUT_MAP[char]
-            return char
+            return char.translate(_layout)
     except Exception:
         # If getting char crashes (pynput issue with certain layouts), return None
         pass
@@ -67,6 +156,25 @@ def get_safe_key_name(key) -> Optional[str]:
     return None
 
 
+def _raise_thread_priority(thread: threading.Thread) -> None:
+    """Bump a thread to above-normal OS priority (Windows only)"""
+    if not IS_WINDOWS:
+        return
+    try:
+        import ctypes
+        
+        THREAD_SET_INFORMATION = 0x0020
+        THREAD_PRIORITY_ABOVE_NORMAL = 1
+        
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenThread(THREAD_SET_INFORMATION, False, thread.native_id)
+        if handle:
+            kernel32.SetThreadPriority(handle, THREAD_PRIORITY_ABOVE_NORMAL)
+            kernel32.CloseHandle(handle)
+    except Exception as e:
+        print(f"Could not raise listener thread priority: {e}")
+
+
 class MasterHotkeyListener:
     """
     Singleton listener that dispatches key events to registered hotkey handlers.
@@ -75,8 +183,17 @@ class MasterHotkeyListener:
     _instance = None
     _lock = threading.Lock()
     _listener = None
-    _handlers = set()
+    _handlers = {}  # handler -> (bound _on_key_press, bound _on_key_release)
+    # Immutable copies of the bound methods for lock-free dispatch, rebuilt on (un)register
+    _press_snapshot = ()
+    _release_snapshot = ()
+    # Bound handler methods when exactly one handler is registered
+    _single_press = None
+    _single_release = None
     _is_running = False
+    # Press/release callbacks of all handlers run in order on one worker thread
+    _callback_queue = queue.SimpleQueue()
+    _callback_thread = None
 
     @classmethod
     def get_instance(cls):
@@ -87,17 +204,56 @@ class MasterHotkeyListener:
 
     def register(self, handler):
         with self._lock:
-            self._handlers.add(handler)
+            self._handlers[handler] = (handler._on_key_press, handler._on_key_release)
+            self._update_snapshot()
+            if self._callback_thread is None:
+                self._start_callback_worker()
             if not self._is_running:
                 self._start()
 
     def unregister(self, handler):
         with self._lock:
-            self._handlers.discard(handler)
+            self._handlers.pop(handler, None)
+            self._update_snapshot()
             # We intentionally do NOT stop the listener when handlers are empty
             # to avoid issues with restarting pynput listener on macOS.
             # It will stop only when the app exits.
 
+    def _update_snapshot(self):
+        """Rebuild dispatch state after handlers change (caller holds the lock)"""
+        methods = tuple(self._handlers.values())
+        self._press_snapshot = tuple(press for press, _ in methods)
+        self._release_snapshot = tuple(release for _, release in methods)
+        if len(methods) == 1:
+            self._single_press, self._single_release = methods[0]
+        else:
+            self._single_press = None
+            self._single_release = None
+
+    def post_callback(self, callback, kind: str) -> None:
+        """Queue a hotkey callback so the listener thread never blocks on it"""
+        self._callback_queue.put((callback, kind))
+
+    def _start_callback_worker(self):
+        """Start the shared callback worker (caller holds the lock)"""
+        thread = threading.Thread(
+            target=self._run_callbacks,
+            args=(self._callback_queue,),
+            daemon=True
+        )
+        thread.start()
+        MasterHotkeyListener._callback_thread = thread
+
+    @staticmethod
+    def _run_callbacks(callbacks: queue.SimpleQueue) -> None:
+        """Worker loop: run queued callbacks one at a time, in event order"""
+        while True:
+            callback, kind = callbacks.get()
+            try:
+                callback()
+            except Exception as e:
+                logger.warning("Hotkey %s callback error: %s", kind, e)
+
     def _start(self):
         try:
             self._listener = keyboard.Listener(
@@ -105,6 +261,7 @@ class MasterHotkeyListener:
                 on_release=self._on_key_release
             )
             self._listener.start()
+            _raise_thread_priority(self._listener)
             self._is_running = True
             print("⌨️  Master Hotkey Listener started")
         except Exception as e:
@@ -122,20 +279,37 @@ class MasterHotkeyListener:
         print("⌨️  Master Hotkey Listener stopped")
 
     def _on_key_press(self, key):
+        # Common case: a single handler, called without the fan-out loop
+        press = self._single_press
+        if press is not None:
+            try:
+                press(key)
+            except Exception as e:
+                logger.warning("Error in hotkey handler press: %s", e)
+            return
+
         # Dispatch to all handlers
-        # We need a copy because handlers might modify the set during callback (unlikely but safe)
-        for handler in list(self._handlers):
+        # Iterate the snapshot: handlers might modify the set during callback (unlikely but safe)
+        for press in self._press_snapshot:
             try:
-                handler._on_key_press(key)
+                press(key)
             except Exception as e:
-                print(f"Error in hotkey handler press: {e}")
+                logger.warning("Error in hotkey handler press: %s", e)
 
     def _on_key_release(self, key):
-        for handler in list(self._handlers):
+        release = self._single_release
+        if release is not None:
             try:
-                handler._on_key_release(key)
+                release(key)
             except Exception as e:
-                print(f"Error in hotkey handler release: {e}")
+                logger.warning("Error in hotkey handler release: %s", e)
+            return
+
+        for release in self._release_snapshot:
+            try:
+                release(key)
+            except Exception as e:
+                logger.warning("Error in hotkey handler release: %s", e)
 
 
 class PushToTalkHotkey:
@@ -144,26 +318,8 @@ class PushToTalkHotkey:
     Uses MasterHotkeyListener to share a single keyboard hook.
     """
     
-    # Key name mappings for display - platform specific
-    if IS_MACOS:
-        KEY_DISPLAY_NAMES = {
-            'cmd': '⌘',
-            'ctrl': '⌃',
-            'alt': '⌥',
-            'shift': '⇧',
-            'space': 'Space',
-        }
-    else:
-        # Windows/Linux
-        KEY_DISPLAY_NAMES = {
-            'cmd': 'Win',
-            'ctrl': 'Ctrl',
-            'alt': 'Alt',
-            'shift': 'Shift',
-            'space': 'Space',
-        }
-    
     # Expose maps via class used by instances, but they refer to module globals now
+    KEY_DISPLAY_NAMES = KEY_DISPLAY_NAMES
     VK_MAP = VK_MAP
     LAYOUT_MAP = LAYOUT_MAP
     VK_TO_CHAR = VK_TO_CHAR
@@ -178,8 +334,8 @@ class PushToTalkHotkey:
         self.on_press_callback = on_press
         self.on_release_callback = on_release
         
-        # Parse hotkey
-        self._required_modifiers, self._main_key = self._parse_hotkey(hotkey)
+        # Parse hotkey (cached per hotkey string)
+        self._required_modifiers, self._main_key, self._display_string = _parse_hotkey_cached(hotkey)
         
         # Resolve Main Key VK
         self._main_key_vk = None
@@ -188,23 +344,15 @@ class PushToTalkHotkey:
         
         # State
         self._is_pressed = False
-        self._current_modifiers: Set[str] = set()
-        self._lock = threading.Lock()
+        self._required_modifiers_mask = sum(_MOD_BITS[mod] for mod in self._required_modifiers)
+        self._current_modifiers_mask = 0
         self._registered = False
+        # MasterHotkeyListener.post_callback, bound in start()
+        self._post_callback: Optional[Callable[[Callable[[], None], str], None]] = None
     
     def _parse_hotkey(self, hotkey: str) -> tuple:
         """Parse hotkey string into modifiers and main key"""
-        parts = hotkey.lower().replace('<', '').replace('>', '').replace('command', 'cmd').replace('control', 'ctrl').split('+')
-        modifiers = set()
-        main_key = None
-        
-        for part in parts:
-            part = part.strip()
-            if part in ('cmd', 'ctrl', 'alt', 'shift'):
-                modifiers.add(part)
-            else:
-                main_key = part
-        
+        modifiers, main_key, _ = _parse_hotkey_cached(hotkey)
         return modifiers, main_key
     
     def _get_key_name(self, key) -> Optional[str]:
@@ -213,104 +361,85 @@ class PushToTalkHotkey:
     
     def _check_modifiers(self) -> bool:
         """Check if all required modifiers are currently pressed"""
-        return self._required_modifiers.issubset(self._current_modifiers)
+        required = self._required_modifiers_mask
+        return (self._current_modifiers_mask & required) == required
     
-    def _matches_main_key(self, key, key_name) -> bool:
+    def _matches_main_key(self, key, _resolve=get_safe_key_name) -> bool:
         """Check if key matches configured main key (using robust multi-strategy)"""
         
+        main_key = self._main_key
+        
         # Strategy 1: Check Virtual Key Code (Physical Position)
-        if self._main_key_vk is not None and hasattr(key, 'vk') and key.vk is not None:
-             if key.vk == self._main_key_vk:
-                 return True
+        # A VK mismatch is not conclusive: VK_MAP holds macOS codes, and ISO
+        # keyboards report a different VK for the backtick/section key.
+        main_key_vk = self._main_key_vk
+        if main_key_vk is not None and getattr(key, 'vk', None) == main_key_vk:
+            return True
         
         # Strategy 2: Check Actual Character (Safe Access) - Fix for ISO Backtick/Section mismatch
         try:
-            if hasattr(key, 'char') and key.char:
-                char = key.char.lower()
-                if char == self._main_key:
-                    return True
-                if char in self.LAYOUT_MAP and self.LAYOUT_MAP[char] == self._main_key:
+            char = getattr(key, 'char', None)
+            if char:
+                char = char.lower()
+                if char == main_key or char.translate(_LAYOUT_TRANS) == main_key:
                     return True
         except Exception:
             pass
             
         # Strategy 3: Check Resolved Key Name (Fallback)
-        if key_name and key_name == self._main_key:
-            return True
-            
-        return False
+        # Resolved only here, so VK/char hits never pay for the full lookup
+        key_name = _resolve(key)
+        return bool(key_name) and key_name == main_key
     
-    def _on_key_press(self, key) -> None:
+    def _on_key_press(self, key, _BITS=_MODIFIER_KEY_BITS) -> None:
         """Handle key press event from master listener"""
         # 1. Modifiers
-        is_modifier = False
-        key_name = None
-        
-        if hasattr(key, 'name'):
-            name = key.name
-            if name in ('cmd', 'ctrl', 'alt', 'shift', 'cmd_r', 'ctrl_r', 'alt_r', 'shift_r'):
-                is_modifier = True
-                key_name = name.replace('_r', '').replace('_l', '')
-        
-        if is_modifier and key_name:
-            self._current_modifiers.add(key_name)
+        name = getattr(key, 'name', None)
+        bit = _BITS.get(name)
+        if bit:
+            self._current_modifiers_mask |= bit
             return
 
-        # 2. Key Check (Robust Match)
-        safe_name = get_safe_key_name(key)
-            
-        if self._matches_main_key(key, safe_name) and self._check_modifiers():
+        # 2. Fast reject: already pressed (auto-repeat) or modifiers not held
+        if self._is_pressed or not self._check_modifiers():
+            return
+
+        # 3. Key Check (Robust Match)
+        if self._matches_main_key(key):
              self._trigger_press()
 
     def _trigger_press(self):
-        with self._lock:
-            # Debounce
-            if not self._is_pressed:
-                self._is_pressed = True
-                print(f"🔥 HOTKEY PRESSED: {self.hotkey_string}")
-                try:
-                    self.on_press_callback()
-                except Exception as e:
-                    print(f"Hotkey press callback error: {e}")
-
-    def _on_key_release(self, key) -> None:
+        # Debounce. No lock needed: MasterHotkeyListener delivers every
+        # event on the single pynput listener thread.
+        if self._is_pressed:
+            return
+        self._is_pressed = True
+        logger.debug("🔥 HOTKEY PRESSED: %s", self.hotkey_string)
+        self._post_callback(self.on_press_callback, "press")
+
+    def _on_key_release(self, key, _BITS=_MODIFIER_KEY_BITS) -> None:
         """Handle key release event from master listener"""
-        is_modifier = False
-        key_name = None
-        if hasattr(key, 'name'):
-            name = key.name
-            if name in ('cmd', 'ctrl', 'alt', 'shift', 'cmd_r', 'ctrl_r', 'alt_r', 'shift_r'):
-                is_modifier = True
-                key_name = name.replace('_r', '').replace('_l', '')
-                
-        if is_modifier and key_name:
-            self._current_modifiers.discard(key_name)
+        name = getattr(key, 'name', None)
+        bit = _BITS.get(name)
+        if bit:
+            self._current_modifiers_mask &= ~bit
             
-        should_release = False
-        
-        # Resolve Safe
-        safe_name = get_safe_key_name(key)
+        # Fast reject: nothing to release
+        if not self._is_pressed:
+            return
         
-        if self._matches_main_key(key, safe_name):
-             should_release = True
-             
-        if not self._check_modifiers():
-            should_release = True
-            
-        if should_release:
-            with self._lock:
-                if self._is_pressed:
-                    self._is_pressed = False
-                    print(f"🔥 HOTKEY RELEASED: {self.hotkey_string}")
-                    try:
-                        self.on_release_callback()
-                    except Exception as e:
-                        print(f"Hotkey release callback error: {e}")
+        # Release on main key up, or as soon as a required modifier is let go
+        if not self._check_modifiers() or self._matches_main_key(key):
+            self._is_pressed = False
+            logger.debug("🔥 HOTKEY RELEASED: %s", self.hotkey_string)
+            self._post_callback(self.on_release_callback, "release")
     
     def start(self) -> None:
         """Register with master listener"""
         if not self._registered:
-            MasterHotkeyListener.get_instance().register(self)
+            listener = MasterHotkeyListener.get_instance()
+            self._post_callback = listener.post_callback
+            listener.register(self)
             self._registered = True
             print(f"⌨️  Push-to-talk hotkey active: {self.get_display_string()} (VK: {self._main_key_vk})")
     
@@ -320,21 +449,11 @@ class PushToTalkHotkey:
             MasterHotkeyListener.get_instance().unregister(self)
             self._registered = False
             self._is_pressed = False
-            self._current_modifiers.clear()
+            self._current_modifiers_mask = 0
     
     def get_display_string(self) -> str:
         """Get human-readable hotkey string"""
-        parts = self.hotkey_string.lower().replace('<', '').replace('>', '').split('+')
-        display_parts = []
-        
-        for part in parts:
-            part = part.strip()
-            if part in self.KEY_DISPLAY_NAMES:
-                display_parts.append(self.KEY_DISPLAY_NAMES[part])
-            else:
-                display_parts.append(part.upper())
-        
-        return ''.join(display_parts)
+        return self._display_string
     
     def is_running(self) -> bool:
         return self._registered
@@ -344,7 +463,7 @@ class PushToTalkHotkey:
 class HotkeyManager:
     """Legacy wrapper - now uses PushToTalkHotkey internally"""
     
-    KEY_DISPLAY_NAMES = PushToTalkHotkey.KEY_DISPLAY_NAMES
+    KEY_DISPLAY_NAMES = KEY_DISPLAY_NAMES
     
     def __init__(
         self,
@@ -353,6 +472,7 @@ class HotkeyManager:
     ):
         self.callback = callback
         self.hotkey_string = hotkey
+        self._display_string = _parse_hotkey_cached(hotkey)[2]
         self._ptt: Optional[PushToTalkHotkey] = None
         self._is_running = False
     
@@ -374,15 +494,7 @@ class HotkeyManager:
         self._is_running = False
     
     def get_display_string(self) -> str:
-        parts = self.hotkey_string.lower().replace('<', '').replace('>', '').split('+')
-        display_parts = []
-        for part in parts:
-            part = part.strip()
-            if part in self.KEY_DISPLAY_NAMES:
-                display_parts.append(self.KEY_DISPLAY_NAMES[part])
-            else:
-                display_parts.append(part.upper())
-        return ''.join(display_parts)
+        return self._display_string
     
     def is_running(self) -> bool:
         return self._is_running
@@ -392,13 +504,12 @@ class HotkeyManager:
         if was_running:
             self.stop()
         self.hotkey_string = hotkey
+        self._display_string = _parse_hotkey_cached(hotkey)[2]
         if was_running:
             self.start()
     
     def capture_hotkey(self, callback: Callable[[str, str], None], timeout: float = 10.0) -> None:
         """Capture a new hotkey combination from user input (SAFE & ROBUST)"""
-        import time
-        
         captured_modifiers: Set[str] = set()
         main_key: Optional[str] = None
         capture_done = threading.Event()
@@ -410,9 +521,8 @@ class HotkeyManager:
                 # 1. Modifiers
                 if hasattr(key, 'name'):
                     key_name = key.name
-                    if key_name in ('cmd', 'ctrl', 'alt', 'shift', 'cmd_r', 'ctrl_r', 'alt_r', 'shift_r'):
-                        mod = key_name.replace('_r', '').replace('_l', '')
-                        captured_modifiers.add(mod)
+                    if key_name in _MODIFIER_KEYS:
+                        captured_modifiers.add(_MODIFIER_BASE[key_name])
                         return
                 
                 # 2. Main Key using SAFE Resolver
@@ -425,7 +535,7 @@ class HotkeyManager:
                         return False # Stop listener
                         
             except Exception as e:
-                print(f"Key capture error: {e}")
+                logger.warning("Key capture error: %s", e)
         
         def on_release(key):
             pass
@@ -434,23 +544,13 @@ class HotkeyManager:
         temp_listener.start()
         
         def wait_for_capture():
-            start = time.time()
-            while time.time() - start < timeout:
-                if capture_done.wait(0.1):
-                    break
-            
+            capture_done.wait(timeout)
             temp_listener.stop()
             
             if main_key and captured_modifiers:
-                parts = [f'<{mod}>' for mod in sorted(captured_modifiers)]
-                parts.append(main_key)
-                pynput_format = '+'.join(parts)
-                
-                display_parts = []
-                for mod in sorted(captured_modifiers):
-                    display_parts.append(self.KEY_DISPLAY_NAMES.get(mod, mod.upper()))
-                display_parts.append(main_key.upper())
-                display_format = ''.join(display_parts)
+                mods = [mod for mod in _MOD_ORDER if mod in captured_modifiers]
+                pynput_format = '+'.join([f'<{mod}>' for mod in mods] + [main_key])
+                display_format = _parse_hotkey_cached(pynput_format)[2]
                 
                 callback(pynput_format, display_format)
             else:
@@ -461,30 +561,12 @@ class HotkeyManager:
 
 def hotkey_string_to_pynput(hotkey: str) -> str:
     """Convert user-friendly hotkey string to pynput format."""
-    hotkey = hotkey.lower().strip()
-    
-    replacements = {
-        'command': 'cmd',
-        'control': 'ctrl',
-        'option': 'alt',
-    }
-    
-    for old, new in replacements.items():
-        hotkey = hotkey.replace(old, new)
-    
-    parts = [p.strip() for p in hotkey.split('+')]
-    formatted = []
-    
-    for part in parts:
-        if part in ('cmd', 'ctrl', 'alt', 'shift'):
-            formatted.append(f'<{part}>')
-        else:
-            formatted.append(part)
-    
-    return '+'.join(formatted)
+    return '+'.join(
+        f'<{part}>' if part in _HOTKEY_MODIFIERS else part
+        for part in _split_hotkey(hotkey.strip())
+    )
 
 
 def pynput_to_display(hotkey: str) -> str:
     """Convert pynput hotkey string to display format"""
-    manager = HotkeyManager(lambda: None, hotkey)
-    return manager.get_display_string()
+    return _parse_hotkey_cached(hotkey)[2]
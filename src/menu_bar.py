@@ -4,9 +4,11 @@ Cross-platform system tray interface
 Uses rumps on macOS, pystray on Windows
 """
 
+import sys
+import functools
 from typing import Optional, Callable, List
 from pathlib import Path
-from .platform import is_macos, is_windows, is_linux
+from .platform import IS_MACOS
 
 
 # Status constants (shared across platforms)
@@ -14,10 +16,31 @@ STATUS_IDLE = "idle"
 STATUS_RECORDING = "recording"
 STATUS_PROCESSING = "processing"
 
+# Bundle root (PyInstaller) or source checkout root
+_APP_DIR = Path(getattr(sys, '_MEIPASS', Path(__file__).parent.parent))
+_ASSETS_DIR = _APP_DIR / "assets"
 
-if is_macos():
+# Static icon per status (recording frames are looked up separately)
+_ICON_FILES = {
+    STATUS_IDLE: "menu_icon_idle.png",
+    STATUS_RECORDING: "menu_icon_recording_0.png",
+    STATUS_PROCESSING: "menu_icon_ready.png",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_asset(name: str) -> Optional[str]:
+    """Path of an asset file as a string, or None if it is missing (checked once per name)"""
+    path = _ASSETS_DIR / name
+    if path.exists():
+        return str(path)
+    return None
+
+
+if IS_MACOS:
     # macOS implementation using rumps
     import rumps
+    from PyObjCTools import AppHelper
     
     class MenuBarApp(rumps.App):
         """Menu Bar application for MWhisper (macOS)"""
@@ -29,6 +52,19 @@ if is_macos():
         ANIMATION_FRAMES = 4
         ANIMATION_INTERVAL = 0.15
         
+        # Menu bar title used when the icon files are missing
+        FALLBACK_ICONS = {
+            STATUS_IDLE: "🎤",
+            STATUS_RECORDING: "🔴",
+            STATUS_PROCESSING: "⏳"
+        }
+        
+        STATUS_TITLES = {
+            STATUS_IDLE: "Status: Ready",
+            STATUS_RECORDING: "Status: Recording...",
+            STATUS_PROCESSING: "Status: Processing..."
+        }
+        
         def __init__(
             self,
             on_toggle: Optional[Callable[[], None]] = None,
@@ -38,6 +74,10 @@ if is_macos():
             on_quit: Optional[Callable[[], None]] = None,
             on_tick: Optional[Callable, None] = None
         ):
+            # Resolve icon files once so status changes don't hit the filesystem
+            self._icon_paths = {}
+            self._load_icon_paths()
+            
             super().__init__(
                 name="MWhisper",
                 icon=self._get_icon_path("idle"),
@@ -53,42 +93,47 @@ if is_macos():
             self._on_tick = on_tick
             
             self._hotkey_display = "⌘⇧D"
+            self._update_toggle_titles()
+            self._last_history_entries = ()  # entries currently shown in the History submenu
+            self._history_items = []  # MenuItems in the History submenu, by position
+            self._history_spare = []  # detached history MenuItems kept for reuse
+            # Last values pushed to AppKit, so unchanged fields are not rewritten
+            self._last_status = None
+            self._last_message = None
+            self._last_icon = None
+            self._last_toggle_title = None
+            self._last_status_title = None
             self._build_menu()
             
-        @rumps.timer(0.5)
-        def _on_tick_callback(self, sender):
+        def request_tick(self) -> None:
+            """Ask for the tick callback to run soon on the main thread"""
             if self._on_tick:
-                self._on_tick(sender)
+                AppHelper.callAfter(self._on_tick, None)
+        
+        def _load_icon_paths(self) -> None:
+            for status in (self.STATUS_IDLE, self.STATUS_RECORDING, self.STATUS_PROCESSING):
+                for frame in range(self.ANIMATION_FRAMES):
+                    self._icon_paths[(status, frame)] = self._resolve_icon_path(status, frame)
         
         def _get_icon_path(self, status: str, frame: int = 0) -> Optional[str]:
-            import sys
-            import os
-            
-            if hasattr(sys, '_MEIPASS'):
-                app_dir = Path(sys._MEIPASS)
-            else:
-                app_dir = Path(__file__).parent.parent
-            
+            # Pure lookup: the main thread never stats files here
+            paths = self._icon_paths
+            key = (status, frame)
+            if key in paths:
+                return paths[key]
+            return paths[(self.STATUS_IDLE, 0)]
+        
+        def _resolve_icon_path(self, status: str, frame: int = 0) -> Optional[str]:
             if status == "recording":
-                frame_path = app_dir / "assets" / f"menu_icon_recording_{frame}.png"
-                if frame_path.exists():
-                    return str(frame_path)
-                
-            icons = {
-                "idle": app_dir / "assets" / "menu_icon_idle.png",
-                "recording": app_dir / "assets" / "menu_icon_recording_0.png",
-                "processing": app_dir / "assets" / "menu_icon_ready.png",
-            }
-            
-            icon_path = icons.get(status, icons["idle"])
-            if icon_path.exists():
-                return str(icon_path)
+                frame_path = _resolve_asset(f"menu_icon_recording_{frame}.png")
+                if frame_path:
+                    return frame_path
             
-            return None
+            return _resolve_asset(_ICON_FILES.get(status, _ICON_FILES[STATUS_IDLE]))
         
         def _build_menu(self) -> None:
             self._toggle_item = rumps.MenuItem(
-                f"Start Recording ({self._hotkey_display})",
+                self._title_start,
                 callback=self._on_toggle_click
             )
             
@@ -96,9 +141,10 @@ if is_macos():
             self._status_item.set_callback(None)
             
             self._history_menu = rumps.MenuItem("History")
-            empty_item = rumps.MenuItem("No history")
-            empty_item.set_callback(None)
-            self._history_menu[empty_item.title] = empty_item
+            self._empty_history_item = rumps.MenuItem("No history")
+            self._empty_history_item.set_callback(None)
+            self._history_menu[self._empty_history_item.title] = self._empty_history_item
+            self._history_placeholder_shown = True
             
             self._settings_item = rumps.MenuItem(
                 "Settings...",
@@ -140,61 +186,95 @@ if is_macos():
                 self._on_history_select(sender._history_index)
         
         def set_status(self, status: str, message: str = "") -> None:
+            if status == self._last_status and message == self._last_message:
+                return
+            self._last_status = status
+            self._last_message = message
             self._status = status
             
             icon_path = self._get_icon_path(status)
             if icon_path:
-                self.icon = icon_path
+                if icon_path != self._last_icon:
+                    self.icon = icon_path
+                    self._last_icon = icon_path
             else:
-                icons = {
-                    self.STATUS_IDLE: "🎤",
-                    self.STATUS_RECORDING: "🔴",
-                    self.STATUS_PROCESSING: "⏳"
-                }
-                self.title = icons.get(status, "🎤")
-            
-            if status == self.STATUS_RECORDING:
-                self._toggle_item.title = f"Stop Recording ({self._hotkey_display})"
-            else:
-                self._toggle_item.title = f"Start Recording ({self._hotkey_display})"
-            
-            status_messages = {
-                self.STATUS_IDLE: "Status: Ready",
-                self.STATUS_RECORDING: "Status: Recording...",
-                self.STATUS_PROCESSING: "Status: Processing..."
-            }
-            status_text = status_messages.get(status, "Status: Ready")
+                self.title = self.FALLBACK_ICONS.get(status, "🎤")
+            
+            toggle_title = self._title_stop if status == self.STATUS_RECORDING else self._title_start
+            if toggle_title != self._last_toggle_title:
+                self._toggle_item.title = toggle_title
+                self._last_toggle_title = toggle_title
+            
             if message:
                 status_text = f"Status: {message}"
-            self._status_item.title = status_text
+            else:
+                status_text = self.STATUS_TITLES.get(status, "Status: Ready")
+            if status_text != self._last_status_title:
+                self._status_item.title = status_text
+                self._last_status_title = status_text
         
         def update_history_menu(self, entries: List[str]) -> None:
             self._update_history_menu(entries)
         
         def _update_history_menu(self, entries: List[str]) -> None:
-            try:
-                if hasattr(self._history_menu, '_menu') and self._history_menu._menu is not None:
-                    self._history_menu.clear()
-                else:
-                    for key in list(self._history_menu.keys()):
-                        del self._history_menu[key]
-            except Exception:
-                pass
-            
-            if not entries:
-                empty_item = rumps.MenuItem("No history")
-                empty_item.set_callback(None)
-                self._history_menu[empty_item.title] = empty_item
+            new_entries = tuple(entries[:10])
+            if new_entries == self._last_history_entries:
                 return
+            self._last_history_entries = new_entries
             
-            for i, entry in enumerate(entries[:10]):
-                item = rumps.MenuItem(entry, callback=self._on_history_item_click)
+            # Coalesce the item changes into a single NSMenu change notification
+            ns_menu = getattr(self._history_menu, '_menu', None)
+            if ns_menu is not None:
+                ns_menu.setMenuChangedMessagesEnabled_(False)
+            try:
+                self._apply_history_entries(new_entries)
+            finally:
+                if ns_menu is not None:
+                    ns_menu.setMenuChangedMessagesEnabled_(True)
+        
+        def _apply_history_entries(self, new_entries: tuple) -> None:
+            # Only touch the items whose position changed; NSMenuItems are reused
+            items = self._history_items
+            if new_entries and self._history_placeholder_shown:
+                del self._history_menu[self._empty_history_item.title]
+                self._history_placeholder_shown = False
+            
+            for i in range(min(len(items), len(new_entries))):
+                if items[i].title != new_entries[i]:
+                    items[i].title = new_entries[i]
+            
+            while len(items) > len(new_entries):
+                self._history_spare.append(items.pop())
+                del self._history_menu[f"history_{len(items)}"]
+            
+            for i in range(len(items), len(new_entries)):
+                if self._history_spare:
+                    item = self._history_spare.pop()
+                    item.title = new_entries[i]
+                else:
+                    item = rumps.MenuItem(new_entries[i], callback=self._on_history_item_click)
                 item._history_index = i
-                self._history_menu[entry] = item
+                # Keyed by position so retitled items keep a stable key
+                self._history_menu[f"history_{i}"] = item
+                items.append(item)
+            
+            if not new_entries and not self._history_placeholder_shown:
+                self._history_menu[self._empty_history_item.title] = self._empty_history_item
+                self._history_placeholder_shown = True
+        
+        def _update_toggle_titles(self) -> None:
+            """Format the toggle item titles for the current hotkey"""
+            self._title_start = f"Start Recording ({self._hotkey_display})"
+            self._title_stop = f"Stop Recording ({self._hotkey_display})"
         
         def set_hotkey_display(self, display: str) -> None:
+            if display == self._hotkey_display:
+                return
             self._hotkey_display = display
-            self.set_status(self._status)
+            self._update_toggle_titles()
+            toggle_title = self._title_stop if self._status == self.STATUS_RECORDING else self._title_start
+            self._toggle_item.title = toggle_title
+            self._last_toggle_title = toggle_title
         
         def show_notification(self, title: str, message: str) -> None:
             rumps.notification(title=title, subtitle="", message=message)
@@ -205,6 +285,7 @@ if is_macos():
 else:
     # Windows/Linux implementation using pystray
     import threading
+    from PIL import Image
     
     class MenuBarApp:
         """System Tray application for MWhisper (Windows/Linux)"""
@@ -213,6 +294,12 @@ else:
         STATUS_RECORDING = STATUS_RECORDING
         STATUS_PROCESSING = STATUS_PROCESSING
         
+        STATUS_TEXTS = {
+            STATUS_IDLE: "Ready",
+            STATUS_RECORDING: "Recording...",
+            STATUS_PROCESSING: "Processing..."
+        }
+        
         def __init__(
             self,
             on_toggle: Optional[Callable[[], None]] = None,
@@ -231,35 +318,32 @@ else:
             self._on_tick = on_tick
             
             self._hotkey_display = "Ctrl+Shift+D"
+            self._update_toggle_titles()
             self._icon = None
             self._running = False
             self._history_entries = []
+            self._menu_sig = None  # (status, hotkey display) of the installed menu
+            self._icon_images = {}  # status -> decoded PIL image
+            self._tick_event = threading.Event()
             
         def _get_icon(self, status: str = "idle"):
-            """Get icon for current status"""
-            from PIL import Image
-            import sys
-            
-            if hasattr(sys, '_MEIPASS'):
-                app_dir = Path(sys._MEIPASS)
-            else:
-                app_dir = Path(__file__).parent.parent
-            
-            icon_files = {
-                "idle": "menu_icon_idle.png",
-                "recording": "menu_icon_recording_0.png",
-                "processing": "menu_icon_ready.png",
-            }
+            """Get icon for current status (decoded once per status)"""
+            img = self._icon_images.get(status)
+            if img is not None:
+                return img
             
-            icon_path = app_dir / "assets" / icon_files.get(status, "menu_icon_idle.png")
+            icon_path = _resolve_asset(_ICON_FILES.get(status, _ICON_FILES[STATUS_IDLE]))
             
-            if icon_path.exists():
-                return Image.open(str(icon_path))
+            if icon_path:
+                img = Image.open(icon_path)
+                img.load()
             else:
                 # Create a simple colored icon as fallback
                 img = Image.new('RGB', (64, 64), 
                     color={'idle': 'green', 'recording': 'red', 'processing': 'yellow'}.get(status, 'gray'))
-                return img
+            
+            self._icon_images[status] = img
+            return img
         
         def _build_menu(self):
             """Build the context menu"""
@@ -278,10 +362,10 @@ else:
                     self._on_quit()
                 self.stop()
             
-            toggle_text = "Stop Recording" if self._status == self.STATUS_RECORDING else "Start Recording"
+            toggle_text = self._title_stop if self._status == self.STATUS_RECORDING else self._title_start
             
             menu_items = [
-                MenuItem(f"{toggle_text} ({self._hotkey_display})", on_toggle),
+                MenuItem(toggle_text, on_toggle),
                 Menu.SEPARATOR,
                 MenuItem(f"Status: {self._get_status_text()}", None, enabled=False),
                 Menu.SEPARATOR,
@@ -293,13 +377,20 @@ else:
             
             return Menu(*menu_items)
         
+        def _update_toggle_titles(self) -> None:
+            """Format the toggle item titles for the current hotkey"""
+            self._title_start = f"Start Recording ({self._hotkey_display})"
+            self._title_stop = f"Stop Recording ({self._hotkey_display})"
+        
+        def _refresh_menu(self) -> None:
+            """Rebuild the tray menu only if something it shows has changed"""
+            sig = (self._status, self._hotkey_display)
+            if self._icon and sig != self._menu_sig:
+                self._icon.menu = self._build_menu()
+                self._menu_sig = sig
+        
         def _get_status_text(self) -> str:
-            status_map = {
-                self.STATUS_IDLE: "Ready",
-                self.STATUS_RECORDING: "Recording...",
-                self.STATUS_PROCESSING: "Processing..."
-            }
-            return status_map.get(self._status, "Ready")
+            return self.STATUS_TEXTS.get(self._status, "Ready")
         
         def run(self):
             """Start the system tray icon"""
@@ -311,45 +402,54 @@ else:
                 "MWhisper",
                 self._build_menu()
             )
+            self._menu_sig = (self._status, self._hotkey_display)
             
             self._running = True
             
-            # Start tick timer in background
+            # Run tick callbacks in background, only when requested
             if self._on_tick:
                 def tick_loop():
-                    import time
                     while self._running:
-                        time.sleep(0.5)
-                        if self._on_tick:
+                        self._tick_event.wait()
+                        self._tick_event.clear()
+                        if self._running and self._on_tick:
                             self._on_tick(None)
                 threading.Thread(target=tick_loop, daemon=True).start()
             
             self._icon.run()
         
+        def request_tick(self) -> None:
+            """Ask for the tick callback to run soon"""
+            self._tick_event.set()
+        
         def stop(self):
             """Stop the system tray icon"""
             self._running = False
+            self._tick_event.set()
             if self._icon:
                 self._icon.stop()
         
         def set_status(self, status: str, message: str = "") -> None:
-            """Update status"""
+            """Update status (the tray shows no message, so only a status change matters)"""
+            if status == self._status:
+                return
             self._status = status
             if self._icon:
                 self._icon.icon = self._get_icon(status)
-                self._icon.menu = self._build_menu()
+            self._refresh_menu()
         
         def update_history_menu(self, entries: List[str]) -> None:
             """Update history entries"""
             self._history_entries = entries[:10]
-            if self._icon:
-                self._icon.menu = self._build_menu()
+            self._refresh_menu()
         
         def set_hotkey_display(self, display: str) -> None:
             """Update hotkey display string"""
+            if display == self._hotkey_display:
+                return
             self._hotkey_display = display
-            if self._icon:
-                self._icon.menu = self._build_menu()
+            self._update_toggle_titles()
+            self._refresh_menu()
         
         def show_notification(self, title: str, message: str) -> None:
             """Show a notification"""
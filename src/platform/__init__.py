@@ -3,14 +3,22 @@ MWhisper Platform Detection
 Cross-platform compatibility layer
 """
 
-import platform
 import sys
 
-# Platform detection
-SYSTEM = platform.system()
-IS_WINDOWS = SYSTEM == "Windows"
-IS_MACOS = SYSTEM == "Darwin"
-IS_LINUX = SYSTEM == "Linux"
+# Platform detection (sys.platform is fixed at interpreter build, no uname call)
+IS_WINDOWS = sys.platform.startswith("win")
+IS_MACOS = sys.platform == "darwin"
+IS_LINUX = sys.platform.startswith("linux")
+
+# Same values platform.system() reports
+if IS_WINDOWS:
+    SYSTEM = "Windows"
+elif IS_MACOS:
+    SYSTEM = "Darwin"
+elif IS_LINUX:
+    SYSTEM = "Linux"
+else:
+    SYSTEM = sys.platform
 
 
 def is_windows() -> bool:
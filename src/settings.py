@@ -5,12 +5,15 @@ Handles loading and saving user preferences
 
 import json
 import os
-from typing import Any, Dict, Optional
+import tempfile
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from pathlib import Path
 
 
-# Default settings
-DEFAULT_SETTINGS: Dict[str, Any] = {
+# Default settings (read-only; wrapped in a MappingProxyType below)
+_DEFAULT_SETTINGS: Dict[str, Any] = {
     "hotkey": "<cmd>+<shift>+d",
     "translate_hotkey": "<cmd>+<shift>+t",
     "microphone_id": None,
@@ -27,11 +30,20 @@ DEFAULT_SETTINGS: Dict[str, Any] = {
     # Custom Actions: List[Dict[str, str]] (id, name, hotkey, prompt)
     "custom_actions": [],
 }
+DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType(_DEFAULT_SETTINGS)
+_DEFAULT_KEYS = frozenset(_DEFAULT_SETTINGS)
+
+# Settings read on hot paths; mirrored into instance attributes so the
+# convenience properties skip the dict lookup
+_HOT_KEYS = ("hotkey", "filter_fillers", "language", "history_size")
 
 
 class Settings:
     """Manages application settings"""
     
+    # Delay before a deferred save hits the disk (bursts of set() share one write)
+    SAVE_DELAY = 0.25
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize settings manager.
@@ -46,7 +58,10 @@ class Settings:
             app_dir = Path(__file__).parent.parent
             self.config_path = app_dir / "config.json"
         
-        self._settings: Dict[str, Any] = DEFAULT_SETTINGS.copy()
+        self._settings: Dict[str, Any] = dict(DEFAULT_SETTINGS)
+        self._save_lock = threading.RLock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._sync_hot_values()
         self.load()
     
     def load(self) -> bool:
@@ -56,15 +71,21 @@ class Settings:
         Returns:
             True if loaded successfully, False if using defaults
         """
+        # The file on disk wins: drop a pending deferred save rather than let it
+        # overwrite what another process (the settings window) just wrote
+        self._cancel_save()
+        
         try:
             if self.config_path.exists():
                 with open(self.config_path, 'r', encoding='utf-8') as f:
                     loaded = json.load(f)
                 
                 # Merge with defaults (to handle new settings)
-                for key, value in loaded.items():
-                    if key in DEFAULT_SETTINGS:
-                        self._settings[key] = value
+                with self._save_lock:
+                    self._settings.update(
+                        (key, value) for key, value in loaded.items() if key in _DEFAULT_KEYS
+                    )
+                    self._sync_hot_values()
                 
                 print(f"✓ Settings loaded from {self.config_path}")
                 return True
@@ -73,6 +94,11 @@ class Settings:
         
         return False
     
+    def _sync_hot_values(self) -> None:
+        """Copy hot-path settings into their instance attributes"""
+        for key in _HOT_KEYS:
+            setattr(self, "_" + key, self._settings.get(key, DEFAULT_SETTINGS[key]))
+    
     def save(self) -> bool:
         """
         Save current settings to config file.
@@ -80,35 +106,86 @@ class Settings:
         Returns:
             True if saved successfully
         """
-        try:
-            # Ensure directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._save_lock:
+            self._cancel_save()
             
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, indent=4, ensure_ascii=False)
-            
-            print(f"✓ Settings saved to {self.config_path}")
-            return True
-        except Exception as e:
-            print(f"Failed to save settings: {e}")
-            return False
+            try:
+                # Ensure directory exists
+                self.config_path.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Write to a temp file and swap it in, so a crash never leaves a truncated config.
+                # The name is unique: the settings window writes the same config from its own process.
+                fd, tmp_path = tempfile.mkstemp(dir=self.config_path.parent, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        json.dump(self._settings, f, indent=4, ensure_ascii=False)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.config_path)
+                except BaseException:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                    raise
+                
+                print(f"✓ Settings saved to {self.config_path}")
+                return True
+            except Exception as e:
+                print(f"Failed to save settings: {e}")
+                return False
+    
+    def _cancel_save(self) -> None:
+        """Drop a pending deferred save, if any"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+    
+    def _schedule_save(self) -> None:
+        """Save after SAVE_DELAY, restarting the delay on every call"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self) -> bool:
+        """
+        Write a pending deferred save immediately.
+        
+        Returns:
+            True if nothing was pending or the save succeeded
+        """
+        with self._save_lock:
+            if self._save_timer is None:
+                return True
+            return self.save()
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a setting value"""
         return self._settings.get(key, default)
     
-    def set(self, key: str, value: Any, save_now: bool = True) -> None:
+    def set(self, key: str, value: Any, save_now: Optional[bool] = None) -> None:
         """
         Set a setting value.
         
         Args:
             key: Setting key
             value: Setting value
-            save_now: If True, save to file immediately
+            save_now: True to save to file immediately, False to not save,
+                None (default) to save shortly after the last change
         """
-        self._settings[key] = value
+        # Under the save lock: the deferred save serializes _settings on the timer thread
+        with self._save_lock:
+            self._settings[key] = value
+            if key in _HOT_KEYS:
+                setattr(self, "_" + key, value)
         if save_now:
             self.save()
+        elif save_now is None:
+            self._schedule_save()
     
     def reset(self, key: Optional[str] = None) -> None:
         """
@@ -117,21 +194,24 @@ class Settings:
         Args:
             key: Specific key to reset, or None for all
         """
-        if key:
-            if key in DEFAULT_SETTINGS:
-                self._settings[key] = DEFAULT_SETTINGS[key]
-        else:
-            self._settings = DEFAULT_SETTINGS.copy()
+        with self._save_lock:
+            if key:
+                if key in DEFAULT_SETTINGS:
+                    self._settings[key] = DEFAULT_SETTINGS[key]
+            else:
+                self._settings.clear()
+                self._settings.update(DEFAULT_SETTINGS)
+            self._sync_hot_values()
         self.save()
     
-    def get_all(self) -> Dict[str, Any]:
-        """Get all settings as dictionary"""
-        return self._settings.copy()
+    def get_all(self) -> Mapping[str, Any]:
+        """Get all settings as a read-only view (use dict() for a mutable copy)"""
+        return MappingProxyType(self._settings)
     
     # Convenience properties
     @property
     def hotkey(self) -> str:
-        return self.get("hotkey", "<cmd>+<shift>+d")
+        return self._hotkey
     
     @hotkey.setter
     def hotkey(self, value: str) -> None:
@@ -147,7 +227,7 @@ class Settings:
     
     @property
     def language(self) -> str:
-        return self.get("language", "auto")
+        return self._language
     
     @language.setter
     def language(self, value: str) -> None:
@@ -155,7 +235,7 @@ class Settings:
     
     @property
     def filter_fillers(self) -> bool:
-        return self.get("filter_fillers", True)
+        return self._filter_fillers
     
     @filter_fillers.setter
     def filter_fillers(self, value: bool) -> None:
@@ -163,7 +243,7 @@ class Settings:
     
     @property
     def history_size(self) -> int:
-        return self.get("history_size", 20)
+        return self._history_size
     
     @property
     def auto_start(self) -> bool:
@@ -6,15 +6,31 @@ Standalone PySide6 application for configuring settings
 import sys
 import os
 import json
-import threading
+import copy
+import tempfile
+import uuid
+from functools import lru_cache, partial
+from pathlib import Path
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
                                QLabel, QLineEdit, QPushButton, QCheckBox, 
                                QMessageBox, QFrame, QSpacerItem, QSizePolicy, QDialog,
-                               QPlainTextEdit, QScrollArea, QComboBox, QGroupBox)
-from PySide6.QtCore import Qt, Signal, QObject, QSize
+                               QPlainTextEdit, QScrollArea, QComboBox, QGroupBox, QGridLayout)
+from PySide6.QtCore import (Qt, Signal, QObject, QSize, QTimer, QSignalBlocker,
+                            QRunnable, QThreadPool)
 from PySide6.QtGui import QFont, QIcon
 
 CONFIG_FILE = "config.json"
+_CONFIG_PATH = Path(__file__).resolve().parent.parent / CONFIG_FILE
+# Bundle root (PyInstaller) or source checkout root
+_ASSETS_DIR = Path(getattr(sys, '_MEIPASS', Path(__file__).resolve().parent.parent)) / "assets"
+
+# pynput modifier tokens -> macOS glyphs
+_HOTKEY_GLYPHS = {
+    '<cmd>': '⌘', '<cmd_r>': '⌘',
+    '<shift>': '⇧', '<shift_r>': '⇧',
+    '<ctrl>': '⌃', '<ctrl_r>': '⌃',
+    '<alt>': '⌥', '<alt_r>': '⌥',
+}
 
 # Dark Matte / Apple Matte Stylesheet
 STYLE_SHEET = """
@@ -140,11 +156,114 @@ QGroupBox::title {
     left: 10px;
     padding: 0 5px;
 }
+
+/* Bottom Bar */
+QWidget#BottomBar {
+    background-color: #2D2D2D;
+    border-top: 1px solid #3A3A3A;
+}
+
+/* Hotkey Recorder */
+QLabel#RecorderInstruction {
+    color: #B0B0B0;
+    font-size: 14px;
+}
+QLabel#RecorderPreview {
+    color: #FFFFFF;
+    padding: 15px;
+    background: #1A1A1A;
+    border: 1px solid #FFFFFF;
+    border-radius: 10px;
+}
+
+/* Custom Actions */
+QPushButton#AddActionButton {
+    background-color: #2D6A4F;
+    font-weight: bold;
+}
+QLabel#EmptyActionsLabel {
+    color: #666666;
+    font-style: italic;
+    margin: 10px;
+}
+QFrame#ActionRow {
+    background-color: #333333;
+    border-radius: 6px;
+    border: 1px solid #444444;
+}
+QLabel#ActionName {
+    font-weight: bold;
+    color: white;
+}
+QLabel#ActionHotkeyPill {
+    background-color: #222;
+    color: #AAA;
+    border-radius: 4px;
+    padding: 2px 6px;
+    font-size: 11px;
+    border: 1px solid #444;
+}
+QPushButton#ActionEditButton, QPushButton#ActionDeleteButton {
+    border: none;
+    background: transparent;
+    color: #AAA;
+}
+QPushButton#ActionEditButton:hover {
+    color: white;
+}
+QPushButton#ActionDeleteButton:hover {
+    color: #FF5555;
+}
 """
 
-class HotkeyRecorderDialog(QDialog):
-    hotkey_recorded = Signal(str)
+# Qt modifier flag -> pynput token, in the cmd, ctrl, alt, shift order that
+# HotkeyManager.capture_hotkey writes (Qt reports Cmd as ControlModifier and
+# Ctrl as MetaModifier on macOS)
+_MOD_TABLE = (
+    ("<cmd>", Qt.ControlModifier),
+    ("<ctrl>", Qt.MetaModifier),
+    ("<alt>", Qt.AltModifier),
+    ("<shift>", Qt.ShiftModifier),
+)
+
+# Non-character Qt keys -> pynput key tokens
+_SPECIAL_KEYS = {
+    Qt.Key_Space: "<space>",
+    Qt.Key_Escape: "<esc>",
+    Qt.Key_Tab: "<tab>",
+    Qt.Key_Return: "<enter>",
+    Qt.Key_Enter: "<enter>",
+    Qt.Key_Backspace: "<backspace>",
+    Qt.Key_Delete: "<delete>",
+    Qt.Key_Home: "<home>",
+    Qt.Key_End: "<end>",
+    Qt.Key_PageUp: "<page_up>",
+    Qt.Key_PageDown: "<page_down>",
+    Qt.Key_Left: "<left>",
+    Qt.Key_Right: "<right>",
+    Qt.Key_Up: "<up>",
+    Qt.Key_Down: "<down>",
+}
+_SPECIAL_KEYS.update({getattr(Qt, f"Key_F{i}"): f"<f{i}>" for i in range(1, 21)})
+
+_PREVIEW_FONT = None
+
+
+def _preview_font() -> QFont:
+    """Big bold font for the recorder preview, built once (needs a QApplication)"""
+    global _PREVIEW_FONT
+    if _PREVIEW_FONT is None:
+        _PREVIEW_FONT = QFont("System", 24, QFont.Bold)
+    return _PREVIEW_FONT
 
+
+@lru_cache(maxsize=256)
+def _display_hotkey(pynput_str: str) -> str:
+    """Format a pynput hotkey string for display, e.g. <cmd>+<shift>+d -> ⌘⇧D, <ctrl>+<f5> -> ⌃F5"""
+    return "".join(_HOTKEY_GLYPHS.get(part, part.strip('<>').upper()) for part in pynput_str.split('+'))
+
+
+class HotkeyRecorderDialog(QDialog):
     def __init__(self, parent=None, title="Record Hotkey"):
         super().__init__(parent)
         self.setWindowTitle(title)
@@ -152,8 +271,6 @@ class HotkeyRecorderDialog(QDialog):
         self.setWindowFlags(Qt.Dialog | Qt.WindowStaysOnTopHint | Qt.CustomizeWindowHint | Qt.WindowTitleHint)
         self.setModal(True)
         
-        self.setStyleSheet(STYLE_SHEET)
-        
         layout = QVBoxLayout()
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
@@ -161,19 +278,13 @@ class HotkeyRecorderDialog(QDialog):
         self.lbl_instruction = QLabel("Press key combination...")
         self.lbl_instruction.setAlignment(Qt.AlignCenter)
         self.lbl_instruction.setProperty("class", "SectionTitle")
-        self.lbl_instruction.setStyleSheet("color: #B0B0B0; font-size: 14px;")
+        self.lbl_instruction.setObjectName("RecorderInstruction")
         layout.addWidget(self.lbl_instruction)
         
         self.lbl_preview = QLabel("Waiting...")
         self.lbl_preview.setAlignment(Qt.AlignCenter)
-        self.lbl_preview.setFont(QFont("System", 24, QFont.Bold))
-        self.lbl_preview.setStyleSheet("""
-            color: #FFFFFF; 
-            padding: 15px; 
-            background: #1A1A1A; 
-            border: 1px solid #FFFFFF;
-            border-radius: 10px;
-        """)
+        self.lbl_preview.setFont(_preview_font())
+        self.lbl_preview.setObjectName("RecorderPreview")
         layout.addWidget(self.lbl_preview)
         
         btn_cancel = QPushButton("Cancel")
@@ -184,53 +295,91 @@ class HotkeyRecorderDialog(QDialog):
         
         self.setLayout(layout)
         self.current_modifiers = set()
+        self.recorded_hotkey = None  # pynput string, set right before accept()
         self.setFocusPolicy(Qt.StrongFocus)
 
     def showEvent(self, event):
         super().showEvent(event)
-        self.activateWindow()
+        if not self.isActiveWindow():
+            self.activateWindow()
         self.setFocus()
         
     def keyPressEvent(self, event):
         key = event.key()
         modifiers = event.modifiers()
         
-        pynput_mods = []
-        if modifiers & Qt.ControlModifier: pynput_mods.append("<cmd>")
-        if modifiers & Qt.MetaModifier: pynput_mods.append("<ctrl>")
-        if modifiers & Qt.AltModifier: pynput_mods.append("<alt>")
-        if modifiers & Qt.ShiftModifier: pynput_mods.append("<shift>")
+        pynput_mods = [name for name, flag in _MOD_TABLE if modifiers & flag]
         
         main_key = ""
         is_mod_key = key in (Qt.Key_Control, Qt.Key_Meta, Qt.Key_Alt, Qt.Key_Shift, Qt.Key_AltGr)
         
         if not is_mod_key:
-            if 0x20 <= key <= 0x7E:
+            # Letters and digits straight from the key code; also keeps Option+D as "d", not "∂"
+            if Qt.Key_A <= key <= Qt.Key_Z:
+                main_key = chr(key | 0x20)
+            elif Qt.Key_0 <= key <= Qt.Key_9:
+                main_key = chr(key)
+            else:
+                main_key = _SPECIAL_KEYS.get(key)
+            if main_key is None:
                 text = event.text()
                 if text:
                     main_key = text.lower()
+                elif 0x20 <= key <= 0x7E:
+                    # No text (e.g. with Cmd held): printable Qt key codes are their ASCII chars
+                    main_key = chr(key).lower()
                 else:
-                    import QKeySequence
-                    main_key = QKeySequence(key).toString().lower()
-            else:
-                 text = event.text()
-                 if text: main_key = text.lower()
+                    main_key = ""
         
         self.current_modifiers = set(pynput_mods)
         
         if main_key:
-            display_str = "+".join(sorted(pynput_mods) + [main_key])
+            display_str = "+".join(pynput_mods + [main_key])
             self.lbl_preview.setText(display_str)
-            hotkey_str = display_str
-            self.hotkey_recorded.emit(hotkey_str)
+            self.recorded_hotkey = display_str
             self.accept()
         else:
-            display_str = "+".join(sorted(pynput_mods)) + "..."
+            display_str = "+".join(pynput_mods) + "..."
             self.lbl_preview.setText(display_str)
 
     def keyReleaseEvent(self, event):
         pass
 
+class _SaveSignals(QObject):
+    finished = Signal(str)  # error message, empty on success
+
+
+class _ConfigSaveTask(QRunnable):
+    """Writes already-serialized config bytes atomically on a pool thread"""
+    
+    def __init__(self, path, data):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.signals = _SaveSignals()
+    
+    def run(self):
+        try:
+            # Unique name: the app process may be saving the same config right now
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(self.data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except Exception as e:
+            self.signals.finished.emit(str(e) or type(e).__name__)
+            return
+        self.signals.finished.emit("")
+
+
 class SettingsWindow(QWidget):
     def __init__(self):
         super().__init__()
@@ -238,42 +387,72 @@ class SettingsWindow(QWidget):
         self.setObjectName("SettingsWindow")
         self.setFixedSize(550, 650) # Taller and wider for better layout
         
-        self.setStyleSheet(STYLE_SHEET)
-        
         self.config = self._load_config()
-        self._setup_ui()
+        self._saved_config = copy.deepcopy(self.config)  # what is on disk now
+        self._save_task = None
+        self._pending_config = None
+        # Build the whole tree without intermediate repaints
+        self.setUpdatesEnabled(False)
+        try:
+            self._setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
         self._center_window()
 
     def _center_window(self):
-        qr = self.frameGeometry()
-        cp = QApplication.primaryScreen().availableGeometry().center()
-        qr.moveCenter(cp)
-        self.move(qr.topLeft())
+        # Plain arithmetic: frameGeometry() asks the window manager before the window is mapped
+        center = QApplication.primaryScreen().availableGeometry().center()
+        size = self.size()
+        self.move(center.x() - size.width() // 2, center.y() - size.height() // 2)
 
     def _load_config(self) -> dict:
         try:
-            config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", CONFIG_FILE)
-            if os.path.exists(config_path):
-                with open(config_path, 'r') as f:
-                    return json.load(f)
+            # Bytes in: one read, and json detects the UTF-8 that Settings.save writes
+            try:
+                with open(_CONFIG_PATH, 'rb') as f:
+                    return json.loads(f.read())
+            except FileNotFoundError:
+                return {}
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load config: {e}")
         return {}
         
     def _save_config(self):
+        if self._save_task is not None:
+            return  # a save is already in flight
         try:
             self.config["openai_api_key"] = self.api_key_input.text().strip()
             self.config["transcription_mode"] = self.mode_combo.currentData()
             self.config["translation_prompt"] = self.prompt_input.toPlainText().strip()
             self.config["fix_prompt"] = self.fix_prompt_input.toPlainText().strip()
             
-            config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", CONFIG_FILE)
-            with open(config_path, 'w') as f:
-                json.dump(self.config, f, indent=4)
-            # No notification as requested by user
-            QApplication.quit()
+            if self.config == self._saved_config:
+                # No notification as requested by user
+                QTimer.singleShot(0, QApplication.quit)
+                return
+            
+            # Serialize here (fast); the file write and fsync run on a pool thread
+            data = json.dumps(self.config, indent=4, ensure_ascii=False).encode('utf-8')
+            self._pending_config = copy.deepcopy(self.config)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save settings: {e}")
+            return
+        
+        task = _ConfigSaveTask(_CONFIG_PATH, data)
+        task.setAutoDelete(False)
+        task.signals.finished.connect(self._on_config_saved)
+        self._save_task = task
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_config_saved(self, error):
+        self._save_task = None
+        if error:
+            QMessageBox.critical(self, "Error", f"Failed to save settings: {error}")
+            return
+        
+        self._saved_config = self._pending_config
+        # No notification as requested by user
+        QApplication.quit()
 
     def _setup_ui(self):
         # 1. Main Layout with Scroll Area
@@ -308,7 +487,9 @@ class SettingsWindow(QWidget):
         self.mode_combo.setFixedWidth(200)
         current_mode = self.config.get("transcription_mode", "parakeet")
         idx = self.mode_combo.findData(current_mode)
-        if idx >= 0: self.mode_combo.setCurrentIndex(idx)
+        if idx >= 0:
+            with QSignalBlocker(self.mode_combo):
+                self.mode_combo.setCurrentIndex(idx)
         mode_row.addWidget(self.mode_combo)
         mode_row.addStretch()
         lay_transcription.addLayout(mode_row)
@@ -328,7 +509,7 @@ class SettingsWindow(QWidget):
         
         self.chk_show_key = QCheckBox("Show")
         self.chk_show_key.setCursor(Qt.PointingHandCursor)
-        self.chk_show_key.stateChanged.connect(self._toggle_show_key)
+        self.chk_show_key.toggled.connect(self._set_echo_mode)
         key_input_container.addWidget(self.chk_show_key)
         lay_openai.addLayout(key_input_container)
         
@@ -336,43 +517,15 @@ class SettingsWindow(QWidget):
         
         # --- Section 3: Standard Actions ---
         grp_std = QGroupBox("Standard Actions")
-        lay_std = QVBoxLayout(grp_std)
-        lay_std.setSpacing(10)
-        
-        def add_hotkey_row(layout, label, key, config_key, default_val):
-            row = QHBoxLayout()
-            lbl = QLabel(label)
-            lbl.setMinimumWidth(120) 
-            lbl.setProperty("class", "FieldLabel")
-            row.addWidget(lbl)
-            
-            row.addStretch()
-            
-            val = self.config.get(config_key, default_val)
-            display = self._get_display_hotkey(val)
-            
-            edit = QLineEdit(display)
-            edit.setReadOnly(True)
-            edit.setAlignment(Qt.AlignCenter)
-            edit.setProperty("class", "HotkeyDisplay")
-            edit.setFixedWidth(140)
-            edit.setFocusPolicy(Qt.NoFocus)
-            row.addWidget(edit)
-            
-            row.addSpacing(10)
-            
-            btn = QPushButton("Change")
-            btn.setCursor(Qt.PointingHandCursor)
-            btn.setFixedWidth(80)
-            btn.clicked.connect(lambda: self._open_recorder(key))
-            row.addWidget(btn)
-            
-            layout.addLayout(row)
-            return edit
-
-        self.edit_dictation = add_hotkey_row(lay_std, "Dictation", "dictation", "hotkey", "<cmd>+<shift>+d")
-        self.edit_translate = add_hotkey_row(lay_std, "Translation", "translate", "translate_hotkey", "<cmd>+<shift>+u")
-        self.edit_fix = add_hotkey_row(lay_std, "Smart Fix", "fix", "fix_hotkey", "<cmd>+<shift>+e")
+        # One grid for all rows: label | stretch | hotkey pill | button
+        lay_std = QGridLayout(grp_std)
+        lay_std.setVerticalSpacing(10)
+        lay_std.setHorizontalSpacing(10)
+        lay_std.setColumnStretch(1, 1)
+        
+        self.edit_dictation = self._add_hotkey_row(lay_std, 0, "Dictation", "dictation", "hotkey", "<cmd>+<shift>+d")
+        self.edit_translate = self._add_hotkey_row(lay_std, 1, "Translation", "translate", "translate_hotkey", "<cmd>+<shift>+u")
+        self.edit_fix = self._add_hotkey_row(lay_std, 2, "Smart Fix", "fix", "fix_hotkey", "<cmd>+<shift>+e")
         
         self.content_layout.addWidget(grp_std)
         
@@ -384,7 +537,7 @@ class SettingsWindow(QWidget):
         cust_header.addStretch()
         btn_add = QPushButton("+ Add Action")
         btn_add.setCursor(Qt.PointingHandCursor)
-        btn_add.setStyleSheet("background-color: #2D6A4F; font-weight: bold;") 
+        btn_add.setObjectName("AddActionButton")
         btn_add.clicked.connect(self._add_custom_action)
         cust_header.addWidget(btn_add)
         lay_custom_outer.addLayout(cust_header)
@@ -394,9 +547,18 @@ class SettingsWindow(QWidget):
         self.actions_layout.setSpacing(8)
         lay_custom_outer.addLayout(self.actions_layout)
         
+        # Layout: [empty label, action rows..., stretch]; rows are reused across refreshes
+        self._action_widgets = {}
+        self._empty_lbl = QLabel("No custom actions defined")
+        self._empty_lbl.setObjectName("EmptyActionsLabel")
+        self._empty_lbl.setAlignment(Qt.AlignCenter)
+        self.actions_layout.addWidget(self._empty_lbl)
+        self.actions_layout.addStretch()
+        
         # Load Existing
         self.custom_actions = self.config.get("custom_actions", [])
         if not isinstance(self.custom_actions, list): self.custom_actions = []
+        self._actions_by_id = {a["id"]: a for a in self.custom_actions}
         self._refresh_actions_list()
         
         self.content_layout.addWidget(grp_custom)
@@ -427,7 +589,6 @@ class SettingsWindow(QWidget):
         # --- Bottom Bar ---
         bottom_bar = QWidget()
         bottom_bar.setObjectName("BottomBar")
-        bottom_bar.setStyleSheet("QWidget#BottomBar { background-color: #2D2D2D; border-top: 1px solid #3A3A3A; }")
         bb_layout = QHBoxLayout(bottom_bar)
         bb_layout.setContentsMargins(20, 15, 20, 15)
         
@@ -450,38 +611,41 @@ class SettingsWindow(QWidget):
         
         main_layout_outer.addWidget(bottom_bar)
 
-    def _toggle_show_key(self, state):
-        if self.chk_show_key.isChecked():
-            self.api_key_input.setEchoMode(QLineEdit.Normal)
-        else:
-            self.api_key_input.setEchoMode(QLineEdit.Password)
+    def _add_hotkey_row(self, grid, row, label, key, config_key, default_val):
+        lbl = QLabel(label)
+        lbl.setMinimumWidth(120) 
+        lbl.setProperty("class", "FieldLabel")
+        grid.addWidget(lbl, row, 0)
+        
+        val = self.config.get(config_key, default_val)
+        display = _display_hotkey(val)
+        
+        edit = QLineEdit(display)
+        edit.setReadOnly(True)
+        edit.setAlignment(Qt.AlignCenter)
+        edit.setProperty("class", "HotkeyDisplay")
+        edit.setFixedWidth(140)
+        edit.setFocusPolicy(Qt.NoFocus)
+        grid.addWidget(edit, row, 2)
+        
+        btn = QPushButton("Change")
+        btn.setCursor(Qt.PointingHandCursor)
+        btn.setFixedWidth(80)
+        btn.clicked.connect(partial(self._open_recorder, key))
+        grid.addWidget(btn, row, 3)
+        
+        return edit
+
+    def _set_echo_mode(self, checked):
+        self.api_key_input.setEchoMode(QLineEdit.Normal if checked else QLineEdit.Password)
             
-    def _get_display_hotkey(self, pynput_str):
-        mapping = {
-            '<cmd>': '⌘', '<cmd_r>': '⌘',
-            '<shift>': '⇧', '<shift_r>': '⇧',
-            '<ctrl>': '⌃', '<ctrl_r>': '⌃',
-            '<alt>': '⌥', '<alt_r>': '⌥',
-        }
-        parts = pynput_str.split('+')
-        display = ""
-        for part in parts:
-            if part in mapping: display += mapping[part]
-            else: display += part.upper()
-        return display
-
-    def _open_recorder(self, target_type):
+    def _open_recorder(self, target_type, _checked=False):
+        # _checked absorbs the bool that clicked() may pass through the partial slot
         dialog = HotkeyRecorderDialog(self, f"Set {target_type.title()} Hotkey")
         
-        current_hotkey = ""
-        def on_recorded(hk):
-            nonlocal current_hotkey
-            current_hotkey = hk
-            
-        dialog.hotkey_recorded.connect(on_recorded)
-        
-        if dialog.exec() == QDialog.Accepted and current_hotkey:
-            display = self._get_display_hotkey(current_hotkey)
+        if dialog.exec() == QDialog.Accepted and dialog.recorded_hotkey:
+            current_hotkey = dialog.recorded_hotkey
+            display = _display_hotkey(current_hotkey)
             if target_type == "dictation":
                 self.edit_dictation.setText(display)
                 self.config["hotkey"] = current_hotkey
@@ -499,13 +663,13 @@ class SettingsWindow(QWidget):
             action = dialog.get_action_data()
             if action:
                 self.custom_actions.append(action)
+                self._actions_by_id[action["id"]] = action
                 self.config["custom_actions"] = self.custom_actions
                 self._refresh_actions_list()
 
     def _edit_custom_action(self, action_id):
         """Edit existing custom action"""
-        # Find action
-        action = next((a for a in self.custom_actions if a["id"] == action_id), None)
+        action = self._actions_by_id.get(action_id)
         if not action: return
         
         dialog = ActionDialog(self, action)
@@ -527,32 +691,50 @@ class SettingsWindow(QWidget):
         )
         
         if confirm == QMessageBox.Yes:
-            self.custom_actions = [a for a in self.custom_actions if a["id"] != action_id]
+            if self._actions_by_id.pop(action_id, None) is None:
+                return
+            self.custom_actions = list(self._actions_by_id.values())
             self.config["custom_actions"] = self.custom_actions
             self._refresh_actions_list()
 
     def _refresh_actions_list(self):
-        """Re-render the actions list"""
-        # Clear existing
-        while self.actions_layout.count():
-            child = self.actions_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        # Add items
-        if not self.custom_actions:
-            empty_lbl = QLabel("No custom actions defined")
-            empty_lbl.setStyleSheet("color: #666666; font-style: italic; margin: 10px;")
-            empty_lbl.setAlignment(Qt.AlignCenter)
-            self.actions_layout.addWidget(empty_lbl)
-        else:
-            for action in self.custom_actions:
-                item = CustomActionWidget(action, self._get_display_hotkey)
+        """Sync the action rows with self.custom_actions, reusing existing widgets"""
+        # One repaint for the whole batch of row changes
+        container = self.actions_layout.parentWidget()
+        if container is not None:
+            container.setUpdatesEnabled(False)
+        try:
+            self._sync_action_rows()
+        finally:
+            if container is not None:
+                container.setUpdatesEnabled(True)
+    
+    def _sync_action_rows(self):
+        widgets = self._action_widgets
+        
+        # Drop rows whose action is gone
+        live_ids = self._actions_by_id
+        for action_id in [i for i in widgets if i not in live_ids]:
+            item = widgets.pop(action_id)
+            self.actions_layout.removeWidget(item)
+            item.deleteLater()
+        
+        # Update or create the rest, in list order (index 0 is the empty label)
+        for index, action in enumerate(self.custom_actions, start=1):
+            item = widgets.get(action["id"])
+            if item is None:
+                item = CustomActionWidget(action, _display_hotkey)
                 item.edit_requested.connect(self._edit_custom_action)
                 item.delete_requested.connect(self._delete_custom_action)
-                self.actions_layout.addWidget(item)
+                widgets[action["id"]] = item
+                self.actions_layout.insertWidget(index, item)
+                continue
+            item.set_action(action, _display_hotkey)
+            if self.actions_layout.indexOf(item) != index:
+                self.actions_layout.removeWidget(item)
+                self.actions_layout.insertWidget(index, item)
         
-        self.actions_layout.addStretch()
+        self._empty_lbl.setVisible(not self.custom_actions)
 
 
 class ActionDialog(QDialog):
@@ -564,7 +746,6 @@ class ActionDialog(QDialog):
         self.setFixedSize(450, 480)
         self.setWindowFlags(Qt.Dialog | Qt.CustomizeWindowHint | Qt.WindowTitleHint)
         self.setModal(True)
-        self.setStyleSheet(STYLE_SHEET)
         
         self._init_ui()
         
@@ -632,19 +813,10 @@ class ActionDialog(QDialog):
         # reuse global recorder
         dialog = HotkeyRecorderDialog(self, "Record Action Hotkey")
         
-        rec_hk = None
-        def on_rec(k): nonlocal rec_hk; rec_hk = k
-        dialog.hotkey_recorded.connect(on_rec)
-        
-        if dialog.exec() == QDialog.Accepted and rec_hk:
+        if dialog.exec() == QDialog.Accepted and dialog.recorded_hotkey:
+            rec_hk = dialog.recorded_hotkey
             self.current_hotkey_pynput = rec_hk
-            # Format for display
-            display = rec_hk
-            mapping = {'<cmd>': '⌘', '<shift>': '⇧', '<ctrl>': '⌃', '<alt>': '⌥'}
-            for k,v in mapping.items(): display = display.replace(k,v)
-            display = display.replace('+', '').upper()
-            
-            self.hotkey_display.setText(display)
+            self.hotkey_display.setText(_display_hotkey(rec_hk))
 
     def _save(self):
         if not self.name_input.text().strip():
@@ -660,7 +832,6 @@ class ActionDialog(QDialog):
         self.accept()
 
     def get_action_data(self):
-        import uuid
         return {
             "id": self.action_data.get("id", str(uuid.uuid4())),
             "name": self.name_input.text().strip(),
@@ -678,38 +849,24 @@ class CustomActionWidget(QFrame):
         super().__init__()
         self.action_id = action["id"]
         
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #333333;
-                border-radius: 6px;
-                border: 1px solid #444444;
-            }
-            QLabel { background: transparent; border: none; }
-        """)
+        # Styling comes from the app-wide STYLE_SHEET via object names
+        self.setObjectName("ActionRow")
         self.setFixedHeight(50)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 5, 10, 5)
         
         # Name
-        name = QLabel(action["name"])
-        name.setStyleSheet("font-weight: bold; color: white;")
-        layout.addWidget(name)
+        self._name_lbl = QLabel(action["name"])
+        self._name_lbl.setObjectName("ActionName")
+        layout.addWidget(self._name_lbl)
         
         layout.addStretch()
         
         # Hotkey Pill
-        hk_text = format_func(action["hotkey"])
-        hk_lbl = QLabel(hk_text)
-        hk_lbl.setStyleSheet("""
-            background-color: #222;
-            color: #AAA;
-            border-radius: 4px;
-            padding: 2px 6px;
-            font-size: 11px;
-            border: 1px solid #444;
-        """)
-        layout.addWidget(hk_lbl)
+        self._hotkey_lbl = QLabel(format_func(action["hotkey"]))
+        self._hotkey_lbl.setObjectName("ActionHotkeyPill")
+        layout.addWidget(self._hotkey_lbl)
         
         layout.addSpacing(10)
         
@@ -718,7 +875,7 @@ class CustomActionWidget(QFrame):
         btn_edit.setFixedSize(24, 24)
         btn_edit.setCursor(Qt.PointingHandCursor)
         btn_edit.setToolTip("Edit")
-        btn_edit.setStyleSheet("QPushButton { border: none; background: transparent; color: #AAA; } QPushButton:hover { color: white; }")
+        btn_edit.setObjectName("ActionEditButton")
         btn_edit.clicked.connect(lambda: self.edit_requested.emit(self.action_id))
         layout.addWidget(btn_edit)
         
@@ -727,13 +884,24 @@ class CustomActionWidget(QFrame):
         btn_del.setFixedSize(24, 24)
         btn_del.setCursor(Qt.PointingHandCursor)
         btn_del.setToolTip("Delete")
-        btn_del.setStyleSheet("QPushButton { border: none; background: transparent; color: #AAA; } QPushButton:hover { color: #FF5555; }")
+        btn_del.setObjectName("ActionDeleteButton")
         btn_del.clicked.connect(lambda: self.delete_requested.emit(self.action_id))
         layout.addWidget(btn_del)
+    
+    def set_action(self, action, format_func):
+        """Refresh the row's texts in place after the action was edited"""
+        self._name_lbl.setText(action["name"])
+        self._hotkey_lbl.setText(format_func(action["hotkey"]))
 
 
 def run_settings():
     app = QApplication(sys.argv)
+    # Parsed once for the whole app; every window and dialog inherits it
+    app.setStyleSheet(STYLE_SHEET)
+    # One app-wide icon that every window and dialog inherits
+    icon_path = _ASSETS_DIR / "app_icon.png"
+    if icon_path.exists():
+        app.setWindowIcon(QIcon(str(icon_path)))
     window = SettingsWindow()
     window.show()
     window.raise_()
@@ -6,7 +6,7 @@ Uses Quartz/AppKit on macOS, pyautogui on Windows
 
 import time
 from typing import Optional
-from .platform import is_macos, is_windows
+from .platform import IS_MACOS, IS_WINDOWS
 
 
 class TextInserter:
@@ -35,9 +35,9 @@ class TextInserter:
             return True
         
         try:
-            if is_macos():
+            if IS_MACOS:
                 return self._insert_macos(text)
-            elif is_windows():
+            elif IS_WINDOWS:
                 return self._insert_windows(text)
             else:
                 # Linux fallback
@@ -218,7 +218,7 @@ class TextInserter:
             return True
         
         try:
-            if is_macos():
+            if IS_MACOS:
                 return self._delete_backwards_macos(count)
             else:
                 return self._delete_backwards_windows(count)
@@ -267,7 +267,7 @@ class TextInserter:
             return True
         
         try:
-            if is_macos():
+            if IS_MACOS:
                 return self._insert_fast_macos(text)
             else:
                 return self._insert_fast_windows(text)
@@ -333,7 +333,7 @@ class TextInserter:
     @staticmethod
     def get_active_app() -> Optional[str]:
         """Get the name of the currently active application"""
-        if is_macos():
+        if IS_MACOS:
             import subprocess
             script = '''
             tell application "System Events"
@@ -347,7 +347,7 @@ class TextInserter:
             )
             if result.returncode == 0:
                 return result.stdout.strip()
-        elif is_windows():
+        elif IS_WINDOWS:
             try:
                 import win32gui
                 return win32gui.GetWindowText(win32gui.GetForegroundWindow())
@@ -358,7 +358,7 @@ class TextInserter:
     @staticmethod
     def check_accessibility() -> bool:
         """Check if we have required permissions"""
-        if is_macos():
+        if IS_MACOS:
             import subprocess
             script = '''
             tell application "System Events"
@@ -6,7 +6,7 @@ Uses Parakeet-MLX on macOS, faster-whisper on Windows
 
 import numpy as np
 from typing import Optional, Dict, Any
-from .platform import is_macos, is_windows
+from .platform import IS_MACOS
 
 
 class Transcriber:
@@ -21,12 +21,12 @@ class Transcriber:
         """
         self.language = language
         self.model = None
-        self._backend = "parakeet" if is_macos() else "faster-whisper"
+        self._backend = "parakeet" if IS_MACOS else "faster-whisper"
         self._load_model()
     
     def _load_model(self) -> None:
         """Load the transcription model"""
-        if is_macos():
+        if IS_MACOS:
             self._load_parakeet()
         else:
             self._load_faster_whisper()
@@ -94,7 +94,7 @@ class Transcriber:
         if np.max(np.abs(audio)) > 1.0:
             audio = audio / np.max(np.abs(audio))
         
-        if is_macos():
+        if IS_MACOS:
             return self._transcribe_parakeet(audio, sample_rate)
         else:
             return self._transcribe_faster_whisper(audio, sample_rate)
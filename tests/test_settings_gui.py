@@ -0,0 +1,28 @@
+"""
+Tests for settings GUI helpers
+"""
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+
+class TestDisplayHotkey:
+    """Test cases for hotkey display formatting"""
+    
+    def test_modifiers_and_letter(self):
+        """Test modifier glyphs followed by an upper-cased letter"""
+        from src.settings_gui import _display_hotkey
+        
+        assert _display_hotkey("<cmd>+<shift>+d") == "⌘⇧D"
+    
+    def test_special_keys_drop_brackets(self):
+        """Test that recorded special keys are shown without angle brackets"""
+        from src.settings_gui import _display_hotkey
+        
+        assert _display_hotkey("<cmd>+<space>") == "⌘SPACE"
+        assert _display_hotkey("<ctrl>+<f5>") == "⌃F5"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
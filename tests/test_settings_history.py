@@ -54,6 +54,43 @@ class TestSettings:
         assert settings.get("custom_key") == "custom_value"
         assert settings.get("nonexistent", "default") == "default"
     
+    def test_deferred_save(self):
+        """Test that set() without save_now is written on flush"""
+        from src.settings import Settings
+        
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        settings = Settings(temp_path)
+        settings.set("language", "uk")
+        settings.set("language", "ru")
+        assert settings.flush() is True
+        
+        with open(temp_path, 'r', encoding='utf-8') as f:
+            assert json.load(f)["language"] == "ru"
+        
+        Path(temp_path).unlink()
+    
+    def test_load_drops_pending_save(self):
+        """Test that load() keeps the file's values over a pending deferred save"""
+        from src.settings import Settings
+        
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        settings = Settings(temp_path)
+        settings.set("language", "uk")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({"language": "ru"}, f)
+        
+        settings.load()
+        assert settings.language == "ru"
+        assert settings.flush() is True
+        with open(temp_path, 'r', encoding='utf-8') as f:
+            assert json.load(f)["language"] == "ru"
+        
+        Path(temp_path).unlink()
+    
     def test_reset(self):
         """Test resetting settings"""
         from src.settings import Settings, DEFAULT_SETTINGS
@@ -106,6 +143,24 @@ class TestHistory:
         history.clear()
         assert len(history) == 0
     
+    def test_recent_rendered(self):
+        """Test rendered recent entries track history changes"""
+        from src.history import DictationHistory
+        
+        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+            history = DictationHistory(f.name)
+        
+        history.add("First")
+        assert history.get_recent_rendered(10) == [str(history.get_by_index(0))]
+        
+        history.add("Second")
+        rendered = history.get_recent_rendered(10)
+        assert len(rendered) == 2
+        assert "Second" in rendered[0]
+        
+        history.delete(0)
+        assert "First" in history.get_recent_rendered(1)[0]
+    
     def test_persistence(self):
         """Test history persistence"""
         from src.history import DictationHistory